@@ -0,0 +1,469 @@
+"""
+Shared MediaWiki client for the render download scripts.
+
+download_all.py (and the per-group scripts that wrap it) resolve "File:..."
+titles through the minecraft.wiki API and download the resulting images.
+WikiClient owns the HTTP side of that: one keep-alive session, batched
+imageinfo lookups and the ETag/Last-Modified cache.
+
+Requirements:
+    pip install requests
+"""
+
+import contextlib
+import email.utils
+import json
+import os
+import socket
+import threading
+import time
+import requests
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from requests.adapters import HTTPAdapter
+from requests.utils import DEFAULT_CA_BUNDLE_PATH
+from urllib3.util import make_headers
+from urllib3.util.retry import Retry
+from urllib3.util.ssl_ import create_urllib3_context
+
+# Configuration
+OUTPUT_DIR = os.path.join(os.path.dirname(__file__), "..", "public", "images", "minecraft-renders")
+API_URL = "https://minecraft.wiki/api.php"
+CONCURRENCY = 8  # Parallel downloads
+COPY_BUFFER_SIZE = 1024 * 1024  # Bytes per read/write when streaming images to disk
+MAX_IMAGE_BYTES = 5 * 1024 * 1024  # Refuse bodies larger than any render we expect
+API_BATCH_SIZE = 50  # MediaWiki's limit on titles per query
+# Ask the wiki for pre-scaled renders this wide (None = original files). The
+# largest in-app view is the ~384px prize preview, so 512px stays sharp on 2x
+# screens while cutting most of the original PNG weight.
+THUMB_WIDTH = 512
+PART_SUFFIX = ".part"  # In-progress downloads are written here, then renamed
+# {filename: {"url", "title", "etag", "last_modified"}} from previous runs
+ETAG_CACHE = os.path.join(os.path.dirname(__file__), ".cache", "etags.json")
+RATE_LIMIT_RPS = 10  # Request ceiling while the wiki is happy
+MAX_BACKOFF_INTERVAL = 5.0  # Slowest pace (seconds between requests) after repeated 429s
+MAX_RATE_LIMIT_RETRIES = 3
+MAX_RETRY_AFTER = 60.0  # Longest Retry-After we wait out; longer asks fail the request
+# Responses that mean "slow down"; they may carry a Retry-After header
+THROTTLE_STATUSES = (429, 503)
+
+HEADERS = {
+    "User-Agent": "KidsLand/1.0 (Educational kids app) Python/3.9",
+    # Compressed API JSON; only advertises codings urllib3 can decode here
+    # (gzip/deflate, plus br/zstd when brotli/zstandard are installed)
+    "Accept-Encoding": make_headers(accept_encoding=True)["accept-encoding"],
+}
+
+
+def prewarm_dns(hosts, port=443):
+    """Resolve each host once so the OS resolver cache is warm.
+
+    Otherwise every worker opening its first connection to a host looks the
+    name up at the same time. Lookup failures are left for the real request
+    to report.
+    """
+    for host in hosts:
+        try:
+            socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+        except OSError:
+            pass
+
+
+def parse_retry_after(value):
+    """Seconds to wait for a Retry-After header (delta-seconds or HTTP-date)."""
+    if not value:
+        return 0.0
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return 0.0
+    return max(0.0, when.timestamp() - time.time())
+
+
+class RateLimiter:
+    """Thread-safe request pacer shared by all worker threads.
+
+    Spaces requests at least min_interval apart. A 429/503 doubles the
+    interval (and honours Retry-After); each successful response decays it
+    back towards 1 / rps.
+    """
+
+    def __init__(self, rps=RATE_LIMIT_RPS):
+        self.base_interval = 1.0 / rps
+        self.min_interval = self.base_interval
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self):
+        """Block until this caller's request slot comes up."""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.min_interval
+        if slot > now:
+            time.sleep(slot - now)
+
+    def backoff(self, pause=0.0):
+        """Slow down after the server answered 429 or 503.
+
+        pause is the Retry-After delay in seconds, capped at MAX_RETRY_AFTER.
+        """
+        pause = min(pause, MAX_RETRY_AFTER)
+        with self._lock:
+            self.min_interval = min(self.min_interval * 2, MAX_BACKOFF_INTERVAL)
+            self._next_slot = max(self._next_slot, time.monotonic() + max(pause, self.min_interval))
+
+    def decay(self):
+        """Drift back towards the base rate after a successful response."""
+        with self._lock:
+            self.min_interval = max(self.base_interval, self.min_interval * 0.9)
+
+
+class TransientRetry(Retry):
+    """urllib3 Retry that also waits before the first retry.
+
+    Stock Retry sleeps 0, 2 * backoff_factor, 4 * backoff_factor, ...; this
+    sleeps backoff_factor * 2 ** attempt, i.e. 0.25s, 0.5s, 1s for 0.25.
+    """
+
+    def get_backoff_time(self):
+        backoff = super().get_backoff_time()
+        if not backoff and self.history and self.history[-1].redirect_location is None:
+            # First consecutive error: urllib3 would retry immediately
+            backoff = min(self.backoff_max, self.backoff_factor)
+        return backoff
+
+
+class SharedTLSAdapter(HTTPAdapter):
+    """HTTPAdapter whose connections all share one pre-loaded TLS context.
+
+    Left alone, urllib3 builds a new SSLContext and re-reads the CA bundle for
+    every connection it opens; here that happens once per adapter. Only
+    direct pools with the default verify=True use it; proxied pools and
+    custom verify settings keep requests' normal per-connection handling.
+    """
+
+    def init_poolmanager(self, *args, **kwargs):
+        self.ssl_context = create_urllib3_context()
+        self.ssl_context.load_verify_locations(DEFAULT_CA_BUNDLE_PATH)
+        kwargs["ssl_context"] = self.ssl_context
+        super().init_poolmanager(*args, **kwargs)
+
+    def build_connection_pool_key_attributes(self, request, verify, cert=None):
+        host_params, pool_kwargs = super().build_connection_pool_key_attributes(request, verify, cert)
+        if verify is not True:
+            # urllib3 would load a custom bundle into (or disable checks on)
+            # the shared context; a None override drops it for this pool
+            pool_kwargs["ssl_context"] = None
+        return host_params, pool_kwargs
+
+    def cert_verify(self, conn, url, verify, cert):
+        super().cert_verify(conn, url, verify, cert)
+        if verify is True and getattr(conn, "conn_kw", {}).get("ssl_context") is self.ssl_context:
+            # The shared context already trusts the default bundle
+            conn.ca_certs = None
+            conn.ca_cert_dir = None
+
+
+class WikiClient:
+    """Resolves and downloads minecraft.wiki images over one shared session.
+
+    Create one instance per process: every lookup and download made through
+    it reuses the same connection pool and validator cache.
+    """
+
+    def __init__(self, etag_cache=ETAG_CACHE):
+        # HTTP/1.1 keep-alive: each host costs one TLS handshake per pooled
+        # connection, and at most CONCURRENCY of them. HTTP/2 multiplexing
+        # would need httpx instead of requests and is not worth it for a few
+        # hundred small images.
+        self.session = requests.Session()
+        self.session.headers.update(HEADERS)
+        self.session.mount("https://", SharedTLSAdapter(
+            # minecraft.wiki plus the static.wikia.nocookie.net image CDN, with headroom
+            pool_connections=4,
+            pool_maxsize=CONCURRENCY,
+            # Wait for a warm pooled connection instead of opening (and then
+            # discarding) extra ones when lookups and downloads overlap
+            pool_block=True,
+            # Connection errors, timeouts and 5xx retry with 0.25s, 0.5s, 1s
+            # backoff. 429/503 are left to the rate limiter so every worker
+            # slows down, not just the one that was throttled.
+            max_retries=TransientRetry(total=3, backoff_factor=0.25, status_forcelist=[500, 502, 504]),
+        ))
+        self.limiter = RateLimiter()
+
+        self.etag_cache = etag_cache
+        self.validators = self._load_validators()
+
+    def _load_validators(self):
+        """Load the {filename: {"url", "etag", ...}} map saved by previous runs."""
+        try:
+            with open(self.etag_cache) as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        # Older caches stored the bare ETag string. Without a "url" those
+        # entries never match a job, so their files are simply kept.
+        return {
+            filename: {"etag": value} if isinstance(value, str) else value
+            for filename, value in cache.items()
+        }
+
+    def save_validators(self):
+        """Persist the validator cache so the next run can send conditional requests."""
+        os.makedirs(os.path.dirname(self.etag_cache), exist_ok=True)
+        with open(self.etag_cache, "w") as f:
+            json.dump(self.validators, f, indent=2, sort_keys=True)
+
+    def validators_for(self, filename, **source):
+        """Cached validators for filename, or {} if they were not recorded for source.
+
+        source is matched against the entry, e.g. url=... or title=... .
+        Several scripts write the same minecraft-<name>.png from different
+        URLs, and one script's ETag means nothing to another's URL.
+        """
+        cached = self.validators.get(filename, {})
+        if all(cached.get(key) == value for key, value in source.items()):
+            return cached
+        return {}
+
+    def get(self, url, **kwargs):
+        """session.get() paced by the rate limiter, retrying after a 429/503."""
+        for _ in range(MAX_RATE_LIMIT_RETRIES):
+            self.limiter.wait()
+            response = self.session.get(url, **kwargs)
+            if response.status_code not in THROTTLE_STATUSES:
+                self.limiter.decay()
+                return response
+            response.raw.drain_conn()
+            retry_after = response.headers.get("Retry-After")
+            pause = parse_retry_after(retry_after)
+            if pause > MAX_RETRY_AFTER:
+                # e.g. a maintenance page asking for an hour: fail this request
+                # rather than silently stalling every worker for that long
+                print(f"  Retry-After {retry_after!r} for {url} is too long; giving up")
+                self.limiter.backoff()
+                return response
+            self.limiter.backoff(pause)
+
+        self.limiter.wait()
+        return self.session.get(url, **kwargs)
+
+    def resolve_urls(self, file_titles):
+        """Resolve file titles to image (or THUMB_WIDTH thumbnail) URLs.
+
+        Sends up to API_BATCH_SIZE titles per request.
+        """
+        file_titles = list(dict.fromkeys(file_titles))
+        urls = {}
+
+        for start in range(0, len(file_titles), API_BATCH_SIZE):
+            params = {
+                "action": "query",
+                "titles": "|".join(file_titles[start:start + API_BATCH_SIZE]),
+                "prop": "imageinfo",
+                "iiprop": "url",
+                "format": "json",
+                "formatversion": "2"
+            }
+            if THUMB_WIDTH:
+                params["iiurlwidth"] = THUMB_WIDTH
+
+            try:
+                response = self.get(API_URL, params=params, timeout=30)
+                response.raise_for_status()
+                query = response.json().get("query", {})
+            except Exception as e:
+                print(f"  API Error: {e}")
+                continue
+
+            # Pages come back under their normalized titles; map them back to ours
+            originals = {n["to"]: n["from"] for n in query.get("normalized", [])}
+            for page in query.get("pages", []):
+                imageinfo = page.get("imageinfo")
+                if imageinfo:
+                    title = originals.get(page["title"], page["title"])
+                    # Fall back to the original when no thumbnail was requested or returned
+                    urls[title] = imageinfo[0].get("thumburl") or imageinfo[0]["url"]
+        return urls
+
+    def _fetch(self, url, output_path):
+        """Stream an image into output_path + PART_SUFFIX. Returns (status, validators).
+
+        Safe to run from many worker threads: it touches only its own .part
+        file and leaves the rename and cache bookkeeping to _commit().
+        """
+        headers = {}
+        cached = self.validators_for(os.path.basename(output_path), url=url)
+        if cached and os.path.exists(output_path):
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
+
+        part_path = output_path + PART_SUFFIX
+        try:
+            with self.get(url, headers=headers, timeout=60, stream=True) as response:
+                if response.status_code == 304:
+                    # Headers only: return the socket to the pool rather than
+                    # letting close() drop an unread streamed connection
+                    response.raw.drain_conn()
+                    return "fresh", cached
+                response.raise_for_status()
+
+                # An HTML error page or empty body must never reach the .part file
+                content_type = response.headers.get("Content-Type", "")
+                if not content_type.startswith("image/"):
+                    raise ValueError(f"expected an image, got {content_type or 'no Content-Type'}")
+                length = response.headers.get("Content-Length")
+                if length is not None and not 0 < int(length) <= MAX_IMAGE_BYTES:
+                    raise ValueError(f"Content-Length {length} is outside 1..{MAX_IMAGE_BYTES} bytes")
+
+                # Let urllib3 undo any Content-Encoding, then copy in large blocks.
+                # The limit is enforced on the bytes actually received too, since
+                # chunked responses have no Content-Length to check up front.
+                response.raw.decode_content = True
+                received = 0
+                with open(part_path, "wb") as f:
+                    while block := response.raw.read(COPY_BUFFER_SIZE):
+                        received += len(block)
+                        if received > MAX_IMAGE_BYTES:
+                            raise ValueError(f"body is over the {MAX_IMAGE_BYTES} byte limit")
+                        f.write(block)
+                validators = {
+                    "url": url,
+                    "etag": response.headers.get("ETag"),
+                    "last_modified": response.headers.get("Last-Modified"),
+                }
+                if not (validators["etag"] or validators["last_modified"]):
+                    return "downloaded", None
+                return "downloaded", {k: v for k, v in validators.items() if v}
+        except Exception as e:
+            print(f"  Download Error: {e}")
+            # Never leave a truncated body behind for the next run to trip over
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(part_path)
+            return "failed", None
+
+    def _commit(self, output_path, validators):
+        """Atomically move a finished .part file into place and record its validators."""
+        os.replace(output_path + PART_SUFFIX, output_path)
+        filename = os.path.basename(output_path)
+        if validators:
+            self.validators[filename] = validators
+        else:
+            # The old ETag/Last-Modified no longer describe the file on disk
+            self.validators.pop(filename, None)
+
+    def download_urls(self, jobs):
+        """Download (name, url, output_path) jobs on CONCURRENCY worker threads.
+
+        jobs may be a lazy iterable; each job is submitted as soon as it is
+        produced. Yields (name, output_path, status) in completion order, where
+        status is "fresh" on 304 Not Modified, "downloaded" if the image was
+        saved, or "failed" on error. Bodies are written to disk on the
+        worker threads, so a slow write only holds up its own download; the
+        renames and cache updates happen on the calling thread. Call
+        save_validators() once done.
+        """
+        with ThreadPoolExecutor(max_workers=CONCURRENCY) as pool:
+            futures = {
+                pool.submit(self._fetch, url, output_path): (name, output_path)
+                for name, url, output_path in jobs
+            }
+            for future in as_completed(futures):
+                name, output_path = futures[future]
+                status, validators = future.result()
+                if status == "downloaded":
+                    self._commit(output_path, validators)
+                yield name, output_path, status
+
+    def download_many(self, mapping, output_dir=OUTPUT_DIR, revalidate=True):
+        """Download every {name: file_title} entry as minecraft-<name>.<ext>.
+
+        Existing files are skipped unless revalidate is set and we hold an
+        ETag or Last-Modified recorded for the same file title, in which case
+        they are re-validated. Returns (counts, failed), where counts is a dict
+        of downloaded/skipped/failed counts and failed lists the names that
+        did not end up on disk.
+        """
+        os.makedirs(output_dir, exist_ok=True)
+        counts = {"downloaded": 0, "skipped": 0, "failed": 0}
+        failed = []
+        # One directory listing instead of a stat() per entry
+        existing = {entry.name for entry in os.scandir(output_dir)}
+
+        # Drop .part files left by an interrupted run; they never reached
+        # their final name, so the images they belong to are re-fetched.
+        for filename in existing:
+            if filename.endswith(PART_SUFFIX):
+                os.unlink(os.path.join(output_dir, filename))
+
+        jobs = []
+        for name, file_title in mapping.items():
+            # Determine file extension from wiki file
+            ext = ".gif" if file_title.endswith(".gif") else ".png"
+            filename = f"minecraft-{name}{ext}"
+            output_path = os.path.join(output_dir, filename)
+
+            tracked = revalidate and self.validators_for(filename, title=file_title)
+            if filename in existing and not tracked:
+                print(f"[SKIP] {name}")
+                counts["skipped"] += 1
+                continue
+
+            jobs.append((name, file_title, output_path))
+
+        submitted = []
+        titles = {}
+
+        def resolved_jobs():
+            # Pipeline the two stages: download_urls() submits each job as it
+            # is yielded, so the pool downloads one batch while this generator
+            # is already resolving the next batch's URLs.
+            for start in range(0, len(jobs), API_BATCH_SIZE):
+                batch = jobs[start:start + API_BATCH_SIZE]
+                image_urls = self.resolve_urls([file_title for _, file_title, _ in batch])
+
+                for name, file_title, output_path in batch:
+                    image_url = image_urls.get(file_title)
+                    if not image_url:
+                        if os.path.basename(output_path) in existing:
+                            # Only queued for re-validation; keep what we have
+                            print(f"[SKIP] {name} ({file_title} not found, keeping existing file)")
+                            counts["skipped"] += 1
+                        else:
+                            print(f"[MISSING] {name} ({file_title}): ✗ Not found")
+                            counts["failed"] += 1
+                            failed.append(name)
+                        continue
+                    submitted.append(name)
+                    titles[output_path] = file_title
+                    yield name, image_url, output_path
+
+        # Every job has been submitted before the first result comes back,
+        # so len(submitted) is the final total by the time it is printed
+        for i, (name, output_path, status) in enumerate(self.download_urls(resolved_jobs()), 1):
+            if status == "fresh":
+                print(f"[FRESH] {name}")
+                counts["skipped"] += 1
+            elif status == "downloaded":
+                filename = os.path.basename(output_path)
+                if filename in self.validators:
+                    # Lets the next run tell this title's file from one saved by another script
+                    self.validators[filename]["title"] = titles[output_path]
+                print(f"[{i}/{len(submitted)}] {name}: ✓ Saved as {filename}")
+                counts["downloaded"] += 1
+            else:
+                print(f"[{i}/{len(submitted)}] {name}: ✗ Download failed")
+                counts["failed"] += 1
+                if os.path.basename(output_path) not in existing:
+                    failed.append(name)
+
+        self.save_validators()
+        return counts, failed
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Download Minecraft renders (items and mobs) listed in renders.json.
+
+Every group is fetched through one WikiClient, so a full refresh shares a
+single connection pool, rate limiter and ETag/Last-Modified cache.
+"missing_mobs" holds corrected file titles and only fills in mobs that are
+still missing after the other groups have run.
+
+Usage: python3 download_all.py [items] [mobs] [missing_mobs]
+
+Requirements:
+    pip3 install requests
+"""
+
+import json
+import os
+import sys
+
+from _wiki_client import OUTPUT_DIR, WikiClient
+
+RENDERS_FILE = os.path.join(os.path.dirname(__file__), "renders.json")
+FALLBACK_GROUP = "missing_mobs"
+
+
+def load_renders():
+    """Load the {group: {name: file_title}} map from renders.json."""
+    with open(RENDERS_FILE) as f:
+        return json.load(f)
+
+
+def download_all(groups=None, client=None):
+    """Download the given renders.json groups (default: all of them).
+
+    Returns a dict of downloaded/skipped/failed counts.
+    """
+    renders = load_renders()
+    groups = groups or list(renders)
+    client = client or WikiClient()
+
+    primary = {}
+    for group in groups:
+        if group != FALLBACK_GROUP:
+            primary.update(renders[group])
+
+    counts = {"downloaded": 0, "skipped": 0, "failed": 0}
+    failed = []
+    if primary:
+        counts, failed = client.download_many(primary, OUTPUT_DIR)
+
+    if FALLBACK_GROUP in groups:
+        # Corrected titles only stand in for mobs the primary pass could not
+        # download, and never overwrite an image we already have
+        retry = {
+            name: file_title for name, file_title in renders[FALLBACK_GROUP].items()
+            if name in failed or name not in primary
+        }
+        if retry:
+            result, _ = client.download_many(retry, OUTPUT_DIR, revalidate=False)
+            for key, value in result.items():
+                counts[key] += value
+            # Each retried mob's outcome is now counted by the fallback pass
+            counts["failed"] -= sum(name in primary for name in retry)
+    return counts
+
+
+def main(groups=None):
+    """Download renders and print a summary."""
+    if groups is None:
+        groups = sys.argv[1:] or None
+
+    print(f"Output directory: {OUTPUT_DIR}")
+    print(f"Downloading renders ({', '.join(groups or load_renders())})...\n")
+
+    counts = download_all(groups)
+
+    print(f"\n{'='*40}")
+    print(f"Summary:")
+    print(f"  Downloaded: {counts['downloaded']}")
+    print(f"  Skipped:    {counts['skipped']}")
+    print(f"  Failed:     {counts['failed']}")
+    print(f"\nImages saved to: {OUTPUT_DIR}")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,34 +4,52 @@ Script to download Minecraft mob renders from the Minecraft Wiki.
 Usage: python download_minecraft_wiki_renders.py
 
 Requirements:
-    pip install requests beautifulsoup4
+    pip install requests beautifulsoup4 lxml
 """
 
+import json
 import os
 import re
-import time
+import shutil
 import requests
+import urllib3
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from requests.adapters import HTTPAdapter
 from urllib.parse import unquote, urljoin
 from bs4 import BeautifulSoup
 
+from _wiki_client import COPY_BUFFER_SIZE, RateLimiter
+
 # Configuration
 BASE_URL = "https://minecraft.wiki"
 CATEGORY_URL = "https://minecraft.wiki/w/Category:Mob_renders"
 OUTPUT_DIR = os.path.join(os.path.dirname(__file__), "..", "public", "images", "minecraft-renders")
-DELAY_BETWEEN_REQUESTS = 0.5  # Be nice to the server
+REQUESTS_PER_SECOND = 4  # Be nice to the server (shared by all workers)
+CONCURRENCY = 8  # File pages resolved and downloaded in parallel
+IMAGE_URL_CACHE = os.path.join(os.path.dirname(__file__), ".cache", "image_urls.json")
 
 # Headers to mimic a browser
 HEADERS = {
     "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
 }
 
+# Characters that are not allowed in filenames on common filesystems
+_SANITIZE_RE = re.compile(r'[<>:"/\\|?*]')
+
+# Shared by all worker threads: one keep-alive pool and one request pacer
+SESSION = requests.Session()
+SESSION.headers.update(HEADERS)
+SESSION.mount("https://", HTTPAdapter(pool_maxsize=CONCURRENCY))
+LIMITER = RateLimiter(rps=REQUESTS_PER_SECOND)
+
 
 def get_page(url):
     """Fetch a page and return BeautifulSoup object."""
     try:
-        response = requests.get(url, headers=HEADERS, timeout=30)
+        LIMITER.wait()
+        response = SESSION.get(url, timeout=30)
         response.raise_for_status()
-        return BeautifulSoup(response.text, "html.parser")
+        return BeautifulSoup(response.text, "lxml")
     except requests.RequestException as e:
         print(f"Error fetching {url}: {e}")
         return None
@@ -39,7 +57,11 @@ def get_page(url):
 
 def get_image_urls_from_category(category_url):
     """Get all image file URLs from a category page (handles pagination)."""
-    all_file_pages = []
+    all_file_pages = {}  # Insertion-ordered set of file page URLs
+    add_file_page = all_file_pages.setdefault
+    # Local bindings keep the per-link loops below off global/attribute lookups
+    _urljoin = urljoin
+    _base = BASE_URL
     current_url = category_url
     page_count = 0
 
@@ -56,19 +78,16 @@ def get_image_urls_from_category(category_url):
         if gallery:
             links = gallery.find_all("a", href=True)
             for link in links:
-                href = link.get("href", "")
+                href = link["href"]
                 if "/w/File:" in href:
-                    full_url = urljoin(BASE_URL, href)
-                    all_file_pages.append(full_url)
+                    add_file_page(_urljoin(_base, href), None)
 
         # Also try the gallery items directly
         gallery_items = soup.select(".gallerybox .thumb a")
         for item in gallery_items:
             href = item.get("href", "")
             if "/w/File:" in href:
-                full_url = urljoin(BASE_URL, href)
-                if full_url not in all_file_pages:
-                    all_file_pages.append(full_url)
+                add_file_page(_urljoin(_base, href), None)
 
         # Find "next page" link
         next_link = None
@@ -79,11 +98,10 @@ def get_image_urls_from_category(category_url):
 
         if next_link and next_link != current_url:
             current_url = next_link
-            time.sleep(DELAY_BETWEEN_REQUESTS)
         else:
             current_url = None
 
-    return list(set(all_file_pages))  # Remove duplicates
+    return list(all_file_pages)
 
 
 def get_full_image_url(file_page_url):
@@ -109,19 +127,50 @@ def get_full_image_url(file_page_url):
     return None
 
 
+def load_image_url_cache():
+    """Load the {file_page_url: image_url} map of past successful downloads."""
+    try:
+        with open(IMAGE_URL_CACHE) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_image_url_cache(cache):
+    """Persist resolved image URLs so re-runs can skip the file page fetch."""
+    os.makedirs(os.path.dirname(IMAGE_URL_CACHE), exist_ok=True)
+    with open(IMAGE_URL_CACHE, "w") as f:
+        json.dump(cache, f, indent=2, sort_keys=True)
+
+
 def download_image(url, output_path):
     """Download an image to the specified path."""
+    # Write to a temp name so an interrupted download is never mistaken
+    # for a finished file by the "skip if exists" check
+    part_path = output_path + ".part"
     try:
-        response = requests.get(url, headers=HEADERS, timeout=60, stream=True)
-        response.raise_for_status()
-        
-        with open(output_path, "wb") as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                f.write(chunk)
+        LIMITER.wait()
+        with SESSION.get(url, timeout=60, stream=True) as response:
+            response.raise_for_status()
+            # Don't save an HTML error page (or an empty body) as a render
+            content_type = response.headers.get("Content-Type", "")
+            if not content_type.startswith("image/") or response.headers.get("Content-Length") == "0":
+                print(f"Error downloading {url}: not an image ({content_type or 'no Content-Type'})")
+                return False
+
+            # Let urllib3 undo any Content-Encoding, then copy in large C-level blocks
+            response.raw.decode_content = True
+            with open(part_path, "wb") as f:
+                shutil.copyfileobj(response.raw, f, length=COPY_BUFFER_SIZE)
+        os.replace(part_path, output_path)
         return True
-    except requests.RequestException as e:
+    # Reading response.raw surfaces urllib3 errors that requests would have wrapped
+    except (requests.RequestException, urllib3.exceptions.HTTPError) as e:
         print(f"Error downloading {url}: {e}")
         return False
+    finally:
+        if os.path.exists(part_path):
+            os.unlink(part_path)
 
 
 def sanitize_filename(filename):
@@ -129,7 +178,7 @@ def sanitize_filename(filename):
     # Decode URL encoding
     filename = unquote(filename)
     # Remove or replace problematic characters
-    filename = re.sub(r'[<>:"/\\|?*]', '_', filename)
+    filename = _SANITIZE_RE.sub('_', filename)
     # Limit length
     if len(filename) > 200:
         name, ext = os.path.splitext(filename)
@@ -137,6 +186,28 @@ def sanitize_filename(filename):
     return filename
 
 
+def process_item(file_page, output_path, image_url_cache):
+    """Resolve and download one file page. Returns (ok, message)."""
+    # Try the URL a previous run downloaded from first; a stale one is
+    # dropped and looked up again rather than failing on every run
+    cached_url = image_url_cache.pop(file_page, None)
+    if cached_url and download_image(cached_url, output_path):
+        image_url_cache[file_page] = cached_url
+        return True, "Downloaded successfully"
+
+    image_url = get_full_image_url(file_page)
+    if not image_url:
+        return False, "Could not find image URL"
+    if image_url == cached_url:
+        return False, "Download failed"
+
+    # Download, and only remember URLs that worked
+    if download_image(image_url, output_path):
+        image_url_cache[file_page] = image_url
+        return True, "Downloaded successfully"
+    return False, "Download failed"
+
+
 def main():
     """Main function to download all mob renders."""
     # Create output directory
@@ -157,8 +228,10 @@ def main():
     downloaded = 0
     skipped = 0
     failed = 0
+    image_url_cache = load_image_url_cache()
 
-    for i, file_page in enumerate(file_pages, 1):
+    jobs = []
+    for file_page in file_pages:
         # Extract filename from URL
         filename = file_page.split("/w/File:")[-1]
         filename = sanitize_filename(filename)
@@ -166,27 +239,26 @@ def main():
 
         # Skip if already exists
         if os.path.exists(output_path):
-            print(f"[{i}/{len(file_pages)}] Skipped (exists): {filename}")
+            print(f"Skipped (exists): {filename}")
             skipped += 1
             continue
 
-        print(f"[{i}/{len(file_pages)}] Processing: {filename}")
-
-        # Get full image URL
-        image_url = get_full_image_url(file_page)
-        if not image_url:
-            print(f"  Could not find image URL")
-            failed += 1
-            continue
-
-        # Download
-        if download_image(image_url, output_path):
-            print(f"  Downloaded successfully")
-            downloaded += 1
-        else:
-            failed += 1
-
-        time.sleep(DELAY_BETWEEN_REQUESTS)
+        jobs.append((file_page, output_path))
+
+    with ThreadPoolExecutor(max_workers=CONCURRENCY) as pool:
+        futures = {
+            pool.submit(process_item, file_page, output_path, image_url_cache): output_path
+            for file_page, output_path in jobs
+        }
+        for i, future in enumerate(as_completed(futures), 1):
+            ok, message = future.result()
+            print(f"[{i}/{len(jobs)}] {os.path.basename(futures[future])}: {message}")
+            if ok:
+                downloaded += 1
+            else:
+                failed += 1
+
+    save_image_url_cache(image_url_cache)
 
     print(f"\n=== Summary ===")
     print(f"Downloaded: {downloaded}")
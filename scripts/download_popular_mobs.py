@@ -10,16 +10,9 @@ Requirements:
 """
 
 import os
-import requests
-import time
+from urllib.parse import urlsplit
 
-# Configuration
-OUTPUT_DIR = os.path.join(os.path.dirname(__file__), "..", "public", "images", "minecraft-renders")
-DELAY = 0.5
-
-HEADERS = {
-    "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
-}
+from _wiki_client import OUTPUT_DIR, WikiClient, prewarm_dns
 
 # Curated list: (filename, wiki_image_url)
 # These URLs point directly to the PNG files on the wiki
@@ -126,50 +119,58 @@ POPULAR_MOBS = {
     "parrot": "https://minecraft.wiki/images/Blue_Parrot_JE1_BE1.png",
 }
 
+# (name, host, url) for every mob, split once at import time
+MOBS = tuple((name, urlsplit(url).netloc, url) for name, url in POPULAR_MOBS.items())
+HOSTS = frozenset(host for _, host, _ in MOBS)
 
-def download_image(url, output_path):
-    """Download an image."""
-    try:
-        response = requests.get(url, headers=HEADERS, timeout=30, stream=True)
-        response.raise_for_status()
-        
-        with open(output_path, "wb") as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                f.write(chunk)
-        return True
-    except requests.RequestException as e:
-        print(f"  Error: {e}")
-        return False
+# (name, url, output_path) download jobs, built once for the dispatcher
+JOBS = tuple(
+    (name, url, os.path.join(OUTPUT_DIR, f"minecraft-{name}.png"))
+    for name, _host, url in MOBS
+)
 
 
 def main():
     """Download all popular mobs."""
     os.makedirs(OUTPUT_DIR, exist_ok=True)
     print(f"Output directory: {OUTPUT_DIR}")
-    print(f"Downloading {len(POPULAR_MOBS)} mob renders...\n")
+    print(f"Downloading {len(MOBS)} mob renders from {len(HOSTS)} hosts...\n")
 
     downloaded = 0
     failed = 0
     skipped = 0
-
-    for name, url in POPULAR_MOBS.items():
-        filename = f"minecraft-{name}.png"
-        output_path = os.path.join(OUTPUT_DIR, filename)
-
-        if os.path.exists(output_path):
+    # One session for all ~70 downloads: each host's TLS handshake is paid once,
+    # and requests only slow down when the server asks via 429/503 Retry-After
+    client = WikiClient()
+    # One directory listing instead of a stat() per mob
+    existing = {entry.name for entry in os.scandir(OUTPUT_DIR)}
+
+    jobs = []
+    for name, url, output_path in JOBS:
+        filename = os.path.basename(output_path)
+        # Files we downloaded from this same URL are re-validated with a
+        # conditional GET instead; anything else on disk is kept as is
+        if filename in existing and not client.validators_for(filename, url=url):
             print(f"[SKIP] {name} (already exists)")
             skipped += 1
             continue
 
-        print(f"[DOWNLOAD] {name}...")
-        
-        if download_image(url, output_path):
-            print(f"  ✓ Saved as {filename}")
+        jobs.append((name, url, output_path))
+
+    prewarm_dns(HOSTS)
+
+    # Downloads are network-bound, so the client's worker threads overlap the round trips
+    for name, output_path, status in client.download_urls(jobs):
+        if status == "fresh":
+            print(f"[FRESH] {name}")
+            skipped += 1
+        elif status == "downloaded":
+            print(f"[DOWNLOAD] {name}: ✓ Saved as {os.path.basename(output_path)}")
             downloaded += 1
         else:
+            print(f"[DOWNLOAD] {name}: ✗ Failed")
             failed += 1
-
-        time.sleep(DELAY)
+    client.save_validators()
 
     print(f"\n=== Summary ===")
     print(f"Downloaded: {downloaded}")